@@ -15,8 +15,10 @@ Uses Park-Miller LCG (MINSTD) for deterministic cross-language RNG:
 import argparse
 import json
 import sys
+from array import array
+from collections import deque
 from pathlib import Path
-from typing import Any, List, Tuple, Dict
+from typing import Any, List, Optional, Tuple, Dict
 
 # Configuration constants - must match src/constants/maze.ts and circuit-noir/src/maze_config.nr
 MAX_MOVES = 500  # Maximum number of moves allowed in solution
@@ -25,16 +27,25 @@ CELL_COLS = 20  # Must equal CELL_ROWS (square maze requirement)
 GRID_SIZE = 41  # Grid dimensions including walls (CELL_ROWS * 2 + 1) - square maze
 START_POS = 1  # Start position in grid coordinates (both row and col)
 END_POS = 39  # End position in grid coordinates (GRID_SIZE - 2, both row and col)
+WRITE_BUFFER_SIZE = 1 << 20  # Large enough to write any generated file in one go
 
 # Direction constants matching frontend encoding
 NORTH, EAST, SOUTH, WEST = 0, 1, 2, 3
-DIRECTIONS = [NORTH, EAST, SOUTH, WEST]
-DIR_OFFSETS = {
-    NORTH: (-1, 0),  # up (row decreases)
-    EAST: (0, 1),    # right (col increases)
-    SOUTH: (1, 0),   # down (row increases)
-    WEST: (0, -1),   # left (col decreases)
-}
+DIGITS = ("0", "1", "2", "3")  # Decimal rendering of each direction
+# Lookup tables indexed by direction
+DIR_OFFSETS = (
+    (-1, 0),  # NORTH: up (row decreases)
+    (0, 1),   # EAST: right (col increases)
+    (1, 0),   # SOUTH: down (row increases)
+    (0, -1),  # WEST: left (col decreases)
+)
+OPPOSITES = (SOUTH, WEST, NORTH, EAST)
+ALL_WALLS = 0x0F  # Wall bitmask with all four walls present (bit = 1 << direction)
+# Translation tables mapping a wall bitmask to 1 if the passage in that direction is open
+EAST_OPEN = bytes(0 if mask & (1 << EAST) else 1 for mask in range(256))
+SOUTH_OPEN = bytes(0 if mask & (1 << SOUTH) else 1 for mask in range(256))
+# Translation table for the ASCII preview: wall (0) -> "#", path (1) -> "."
+PREVIEW_TABLE = bytes.maketrans(b"\x00\x01", b"#.")
 
 class SimpleLCG:
     """Park-Miller Linear Congruential Generator (MINSTD)
@@ -47,26 +58,101 @@ class SimpleLCG:
         # Ensure seed is non-zero (0 would produce all zeros)
         self.state = seed if seed != 0 else 1
 
-    def next(self) -> float:
-        """Generate next random number in range [0, 1)"""
+    def _advance(self) -> int:
+        """Advance the generator and return the new state
+
+        m = 2^31 - 1 is a Mersenne prime, so % m could be a shift/mask fold;
+        CPython's % is faster on these word-sized ints, so it is kept.
+        """
         # Park-Miller constants: a = 48271, m = 2^31 - 1
         self.state = (self.state * 48271) % 2147483647
-        return self.state / 2147483647
+        return self.state
+
+    def next(self) -> float:
+        """Generate next random number in range [0, 1)"""
+        return self._advance() / 2147483647
+
+    def choice_index(self, n: int) -> int:
+        """Generate random index in range [0, n)
+
+        Integer-only equivalent of int(self.next() * n): computes
+        (state * n) // m, matching choice_index in the Rust and frontend ports.
+        The results are identical: m is prime and 0 <= state < m, so for
+        state > 0, state * n / m is never an integer and the float rounding in
+        the division-based form can never cross an integer boundary; state == 0
+        gives 0 either way.
+        """
+        return (self._advance() * n) // 2147483647
 
     def randint(self, a: int, b: int) -> int:
         """Generate random integer in range [a, b]"""
-        return a + int(self.next() * (b - a + 1))
+        return a + self.choice_index(b - a + 1)
 
     def choice(self, items: List) -> Any:
         """Choose random item from list"""
-        return items[int(self.next() * len(items))]
+        return items[self.choice_index(len(items))]
 
-class Cell:
-    def __init__(self, row: int, col: int):
-        self.row = row
-        self.col = col
-        self.walls = {NORTH: True, EAST: True, SOUTH: True, WEST: True}
-        self.visited = False
+def _format_padded_moves(moves: List[int]) -> str:
+    """Format moves zero-padded to MAX_MOVES as a comma-separated list body."""
+    padding = ", 0" * (MAX_MOVES - len(moves))
+    if not moves:
+        return padding[2:]
+    return ", ".join([DIGITS[move] for move in moves]) + padding
+
+def _write_files(files: List[Tuple[Path, str, str]]):
+    """
+    Write generated files, each with a single buffered write.
+    files holds (path, content, description) tuples; description names the
+    file in error messages. Each distinct parent directory is created once.
+    """
+    created = set()
+    for path, content, description in files:
+        try:
+            if path.parent not in created:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created.add(path.parent)
+            with path.open("w", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(content)
+        except IOError as e:
+            raise IOError(f"Failed to write {description} to {path}: {e}")
+
+def _index_offsets(cols: int) -> Tuple[int, int, int, int]:
+    """Row-major cell index offset for each direction, derived from DIR_OFFSETS."""
+    return tuple(dr * cols + dc for dr, dc in DIR_OFFSETS)
+
+def _bfs(walls: bytearray, cols: int, start: int,
+         end: int) -> Optional[List[Optional[Tuple[int, int]]]]:
+    """
+    Breadth-first search over maze cells using their wall bitmasks.
+    Cells are row-major indices; returns (predecessor, direction taken from it)
+    for each reached cell (None elsewhere, and (start, -1) for start itself),
+    or None if end is unreachable.
+    """
+    # Direction, wall bit and index offset for each step (north, east, south, west).
+    # Outer walls are never carved, so an open wall always leads to a valid cell.
+    steps = tuple((direction, 1 << direction, offset)
+                  for direction, offset in enumerate(_index_offsets(cols)))
+    queue = deque([start])
+    popleft = queue.popleft
+    push = queue.append
+    # The parent table doubles as the visited set: a cell is seen once it has an entry
+    parent: List[Optional[Tuple[int, int]]] = [None] * len(walls)
+    parent[start] = (start, -1)
+
+    while queue:
+        idx = popleft()
+        if idx == end:
+            return parent
+        mask = walls[idx]
+
+        for direction, bit, offset in steps:
+            if not mask & bit:
+                nidx = idx + offset
+                if parent[nidx] is None:
+                    parent[nidx] = (idx, direction)
+                    push(nidx)
+
+    return None
 
 class Maze:
     def __init__(self, rows: int, cols: int, seed: int = None):
@@ -83,58 +169,61 @@ class Maze:
         else:
             self.seed = seed
         self.rng = SimpleLCG(self.seed)
-        self.cells = [[Cell(r, c) for c in range(cols)] for r in range(rows)]
+        # Per-cell state stored row-major at index row * cols + col:
+        # walls is a bitmask with bit (1 << direction) set while that wall stands
+        self.walls = bytearray([ALL_WALLS]) * (rows * cols)
+        self.visited = bytearray(rows * cols)
         # Start and end are always at opposite corners in cell coordinates
         self.start = (0, 0)
         self.end = (rows - 1, cols - 1)
 
-    def get_opposite_direction(self, direction: int) -> int:
-        """Get the opposite direction."""
-        opposites = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
-        return opposites[direction]
-
-    def get_neighbor(self, cell: Cell, direction: int) -> Tuple[int, int]:
-        """Get neighbor cell coordinates in given direction."""
-        dr, dc = DIR_OFFSETS[direction]
-        return (cell.row + dr, cell.col + dc)
-
-    def is_valid_cell(self, row: int, col: int) -> bool:
-        """Check if cell coordinates are within bounds."""
-        return 0 <= row < self.rows and 0 <= col < self.cols
-
-    def get_unvisited_neighbors(self, cell: Cell) -> List[Tuple[int, Cell]]:
-        """Get list of unvisited neighboring cells with their directions."""
-        neighbors = []
-        for direction in DIRECTIONS:
-            nr, nc = self.get_neighbor(cell, direction)
-            if self.is_valid_cell(nr, nc):
-                neighbor_cell = self.cells[nr][nc]
-                if not neighbor_cell.visited:
-                    neighbors.append((direction, neighbor_cell))
-        return neighbors
-
-    def remove_wall(self, cell: Cell, direction: int, neighbor: Cell):
-        """Remove wall between current cell and neighbor."""
-        cell.walls[direction] = False
-        neighbor.walls[self.get_opposite_direction(direction)] = False
-
     def generate_recursive_backtracker(self):
         """Generate maze using Recursive Backtracker (DFS) algorithm."""
-        stack = []
-        current = self.cells[self.start[0]][self.start[1]]
-        current.visited = True
-        stack.append(current)
-
-        while stack:
-            neighbors = self.get_unvisited_neighbors(current)
-            if neighbors:
-                direction, next_cell = self.rng.choice(neighbors)
-                self.remove_wall(current, direction, next_cell)
-                next_cell.visited = True
-                stack.append(next_cell)
-                current = next_cell
+        # Bind hot lookups once rather than resolving attributes every step
+        rows, cols = self.rows, self.cols
+        walls = self.walls
+        visited = self.visited
+        choice_index = self.rng.choice_index
+        offsets = _index_offsets(cols)
+
+        # Fixed-capacity stack of cell indices (row * cols + col); each cell is pushed once
+        stack = array("i", [0]) * (rows * cols)
+        # Scratch buffer for the directions of the (at most four) unvisited neighbors
+        dirs = array("b", [0]) * 4
+        current = self.start[0] * cols + self.start[1]
+        visited[current] = 1
+        stack[0] = current
+        sp = 1
+
+        while sp:
+            row, col = divmod(current, cols)
+            # Collect unvisited neighbors in NORTH, EAST, SOUTH, WEST order
+            count = 0
+            if row > 0 and not visited[current - cols]:
+                dirs[count] = NORTH
+                count += 1
+            if col < cols - 1 and not visited[current + 1]:
+                dirs[count] = EAST
+                count += 1
+            if row < rows - 1 and not visited[current + cols]:
+                dirs[count] = SOUTH
+                count += 1
+            if col > 0 and not visited[current - 1]:
+                dirs[count] = WEST
+                count += 1
+
+            if count:
+                direction = dirs[choice_index(count)]
+                # Remove the wall on both sides of the passage
+                walls[current] &= ~(1 << direction)
+                current += offsets[direction]
+                walls[current] &= ~(1 << OPPOSITES[direction])
+                visited[current] = 1
+                stack[sp] = current
+                sp += 1
             else:
-                current = stack.pop()
+                sp -= 1
+                current = stack[sp]
 
     def to_binary_grid(self) -> List[List[int]]:
         """
@@ -145,29 +234,29 @@ class Maze:
 
         For a 20x20 maze, this creates a 41x41 grid (20*2 + 1)
         """
+        flat, width = self.to_flat_grid()
+        return [list(flat[i:i + width]) for i in range(0, len(flat), width)]
+
+    def to_flat_grid(self) -> Tuple[bytearray, int]:
+        """
+        Convert maze to a row-major flattened binary grid.
+        Returns (flat, width) where position (r, c) lives at index r * width + c.
+        """
         # Grid size: rows*2 + 1 (to include walls between cells and borders)
-        grid_rows = self.rows * 2 + 1
-        grid_cols = self.cols * 2 + 1
-        grid = [[0 for _ in range(grid_cols)] for _ in range(grid_rows)]
+        width = self.cols * 2 + 1
+        flat = bytearray(width * (self.rows * 2 + 1))
+        centers = b"\x01" * self.cols
 
         for row in range(self.rows):
-            for col in range(self.cols):
-                cell = self.cells[row][col]
-                # Cell center position in grid
-                gr, gc = row * 2 + 1, col * 2 + 1
-                grid[gr][gc] = 1  # Cell itself is always path
-
-                # Open passages based on walls
-                if not cell.walls[NORTH]:
-                    grid[gr - 1][gc] = 1
-                if not cell.walls[SOUTH]:
-                    grid[gr + 1][gc] = 1
-                if not cell.walls[EAST]:
-                    grid[gr][gc + 1] = 1
-                if not cell.walls[WEST]:
-                    grid[gr][gc - 1] = 1
-
-        return grid
+            walls = self.walls[row * self.cols:(row + 1) * self.cols]
+            # Start of the grid row holding this row's cell centers
+            base = (row * 2 + 1) * width
+            flat[base + 1:base + width:2] = centers  # Cells themselves are always path
+            # Open passages: each cell's east/south wall is its neighbor's west/north wall
+            flat[base + 2:base + width:2] = walls.translate(EAST_OPEN)
+            flat[base + width + 1:base + 2 * width:2] = walls.translate(SOUTH_OPEN)
+
+        return flat, width
 
     def get_grid_coordinates(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """Get start and end coordinates in the binary grid."""
@@ -175,67 +264,33 @@ class Maze:
         end_grid = (self.end[0] * 2 + 1, self.end[1] * 2 + 1)
         return start_grid, end_grid
 
-    def solve_bfs(self) -> List[Tuple[int, int]]:
-        """Solve the maze using BFS and return the path."""
-        from collections import deque
-
-        grid = self.to_binary_grid()
-        start_grid, end_grid = self.get_grid_coordinates()
-
-        queue = deque([(start_grid, [start_grid])])
-        visited = {start_grid}
-
-        while queue:
-            pos, path = queue.popleft()
-            row, col = pos
-
-            if pos == end_grid:
-                return path
-
-            # Try all four directions
-            for dr, dc in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
-                new_row, new_col = row + dr, col + dc
-                new_pos = (new_row, new_col)
-
-                if (0 <= new_row < len(grid) and
-                    0 <= new_col < len(grid[0]) and
-                    grid[new_row][new_col] == 1 and
-                    new_pos not in visited):
-                    visited.add(new_pos)
-                    queue.append((new_pos, path + [new_pos]))
-
-        return []  # No solution found
+    def solve_bfs(self) -> Optional[List[int]]:
+        """
+        Solve the maze using BFS and return the uncompressed moves - one
+        direction per grid step - or None if the maze is not solvable.
+        """
+        start = self.start[0] * self.cols + self.start[1]
+        end = self.end[0] * self.cols + self.end[1]
 
-    def path_to_moves(self, path: List[Tuple[int, int]]) -> List[int]:
-        """Convert path to uncompressed moves format - one direction per step."""
-        if len(path) < 2:
-            return []
+        parent = _bfs(self.walls, self.cols, start, end)
+        if parent is None:
+            return None
 
-        # Convert path to simple direction moves (no compression)
+        # Walk predecessors back from the end, emitting moves as we go.
+        # Each cell step crosses a passage, i.e. two grid steps in one direction.
         moves = []
-
-        for i in range(1, len(path)):
-            prev = path[i - 1]
-            curr = path[i]
-            dr = curr[0] - prev[0]
-            dc = curr[1] - prev[1]
-
-            # Determine direction and add it
-            if dr == -1:
-                moves.append(NORTH)  # 0
-            elif dr == 1:
-                moves.append(SOUTH)  # 2
-            elif dc == 1:
-                moves.append(EAST)   # 1
-            else:
-                moves.append(WEST)   # 3
-
+        idx = end
+        while idx != start:
+            idx, direction = parent[idx]
+            moves.append(direction)
+            moves.append(direction)
+        moves.reverse()
         return moves
 
-    def export_maze_config(self, output_path: Path, grid: List[List[int]],
+    def maze_config_source(self, grid: List[List[int]],
                            start_grid: Tuple[int, int], end_grid: Tuple[int, int],
-                           path_length: int, moves_count: int, sample_moves: List[int]):
-        """Export maze configuration to Noir circuit file."""
+                           path_length: int, moves_count: int, sample_moves: List[int]) -> str:
+        """Render maze configuration as Noir source."""
         # Validate square maze assumption
         if len(grid) != len(grid[0]):
             raise ValueError(f"Maze must be square! Got {len(grid)}x{len(grid[0])}")
@@ -247,10 +302,10 @@ class Maze:
             raise ValueError(f"End position must be diagonal (row == col), got {end_grid}")
 
         # Format as Noir array
-        grid_str = "[\n"
-        for row in grid:
-            grid_str += "        [" + ", ".join(str(cell) for cell in row) + "],\n"
-        grid_str = grid_str.rstrip(",\n") + "\n    ]"
+        # Every row has the same width, so render them all through one template
+        row_fmt = "        [" + ", ".join(["%d"] * len(grid[0])) + "]"
+        rows_str = [row_fmt % tuple(row) for row in grid]
+        grid_str = "[\n" + ",\n".join(rows_str) + "\n    ]"
 
         noir_code = f"""// Auto-generated by generate_maze.py - do not edit manually!
 // Seed: {self.seed}
@@ -269,41 +324,21 @@ pub global MAZE: [[u8; {len(grid[0])}]; {len(grid)}] = {grid_str};
 // Moves: {moves_count} directions (uncompressed)
 // Sample: {sample_moves[:30]}{'...' if len(sample_moves) > 30 else ''}
 """
+        return noir_code
 
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(noir_code)
-            print(f"✅ Noir configuration written to {output_path}")
-            print(f"   Grid size: {len(grid)}x{len(grid[0])} (square)")
-            print(f"   Start: ({start_grid[0]}, {start_grid[0]}), End: ({end_grid[0]}, {end_grid[0]})")
-            print(f"   Solution: {path_length} positions, {moves_count} moves")
-            print(f"   Sample moves: {sample_moves[:40]}{'...' if len(sample_moves) > 40 else ''}")
-        except IOError as e:
-            raise IOError(f"Failed to write maze config to {output_path}: {e}")
-
-    def export_prover_inputs(self, output_path: Path, moves: List[int]):
-        """Export prover inputs to Prover.toml file."""
-        padded_moves = moves + [0] * (MAX_MOVES - len(moves))
-
+    def prover_inputs_source(self, moves: List[int]) -> str:
+        """Render prover inputs as Prover.toml contents."""
         prover_content = f"""# Auto-generated by generate_maze.py - do not edit manually!
 # Seed: {self.seed}
 # {len(moves)} actual moves + {MAX_MOVES - len(moves)} padding zeros = {MAX_MOVES} total
 
 maze_seed = {self.seed}
-moves = [{', '.join(map(str, padded_moves))}]
+moves = [{_format_padded_moves(moves)}]
 """
+        return prover_content
 
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(prover_content)
-            print(f"✅ Prover inputs written to {output_path}")
-        except IOError as e:
-            raise IOError(f"Failed to write prover inputs to {output_path}: {e}")
-
-    def export_test_solution(self, output_path: Path, moves: List[int]):
-        """Export test solution to test_solutions.nr file."""
-        padded_moves = moves + [0] * (MAX_MOVES - len(moves))
-
+    def test_solution_source(self, moves: List[int]) -> str:
+        """Render test solution as test_solutions.nr source."""
         test_content = f"""// Auto-generated by generate_maze.py - do not edit manually!
 // Seed: {self.seed}
 
@@ -313,56 +348,59 @@ use crate::maze_config::MAZE_SEED;
 #[test]
 fn test_generated_solution() {{
     // BFS-generated solution: {len(moves)} moves + {MAX_MOVES - len(moves)} padding zeros = {MAX_MOVES} total
-    let moves = [{', '.join(map(str, padded_moves))}];
+    let moves = [{_format_padded_moves(moves)}];
 
     // This should pass if the circuit logic is correct
     main(moves, MAZE_SEED);
 }}
 """
+        return test_content
 
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(test_content)
-            print(f"✅ Test solution written to {output_path}")
-        except IOError as e:
-            raise IOError(f"Failed to write test solution to {output_path}: {e}")
-
-    def export_risczero_moves(self, output_path: Path, moves: List[int]):
-        """Export moves to circuit-risczero directory as JSON file."""
-        moves_json = json.dumps(moves, indent=2)
+    def risczero_moves_source(self, moves: List[int]) -> str:
+        """Render moves as RISC Zero JSON input."""
+        return json.dumps(moves, indent=2) + "\n"
 
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(moves_json + "\n")
-            print(f"✅ RISC Zero moves written to {output_path}")
-        except IOError as e:
-            raise IOError(f"Failed to write RISC Zero moves to {output_path}: {e}")
-
-    def export_for_noir(self):
-        """Export maze configuration for Noir circuit with test case and prover inputs."""
+    def export_for_noir(self, grid: Optional[List[List[int]]] = None):
+        """
+        Export maze configuration for Noir circuit with test case and prover inputs.
+        Pass a grid already built by to_binary_grid() to avoid rebuilding it.
+        """
         output_dir = Path(".")
 
-        grid = self.to_binary_grid()
+        if grid is None:
+            grid = self.to_binary_grid()
         start_grid, end_grid = self.get_grid_coordinates()
 
         # Solve the maze and validate it's solvable
-        path = self.solve_bfs()
-        if not path:
+        moves = self.solve_bfs()
+        if moves is None:
             raise ValueError("Generated maze is not solvable!")
 
-        moves = self.path_to_moves(path)
-
-        # Export to three separate files
+        # Export to four separate files, rendering everything before writing
         maze_config_path = output_dir / "circuit-noir" / "src" / "maze_config.nr"
         prover_path = output_dir / "circuit-noir" / "Prover.toml"
         test_path = output_dir / "circuit-noir" / "src" / "test_solutions.nr"
         risczero_moves_path = output_dir / "circuit-risczero" / f"{self.seed}_moves.json"
 
-        self.export_maze_config(maze_config_path, grid, start_grid, end_grid,
-                               len(path), len(moves), moves)
-        self.export_prover_inputs(prover_path, moves)
-        self.export_test_solution(test_path, moves)
-        self.export_risczero_moves(risczero_moves_path, moves)
+        path_length = len(moves) + 1
+        _write_files([
+            (maze_config_path,
+             self.maze_config_source(grid, start_grid, end_grid,
+                                     path_length, len(moves), moves),
+             "maze config"),
+            (prover_path, self.prover_inputs_source(moves), "prover inputs"),
+            (test_path, self.test_solution_source(moves), "test solution"),
+            (risczero_moves_path, self.risczero_moves_source(moves), "RISC Zero moves"),
+        ])
+
+        print(f"✅ Noir configuration written to {maze_config_path}")
+        print(f"   Grid size: {len(grid)}x{len(grid[0])} (square)")
+        print(f"   Start: ({start_grid[0]}, {start_grid[0]}), End: ({end_grid[0]}, {end_grid[0]})")
+        print(f"   Solution: {path_length} positions, {len(moves)} moves")
+        print(f"   Sample moves: {moves[:40]}{'...' if len(moves) > 40 else ''}")
+        print(f"✅ Prover inputs written to {prover_path}")
+        print(f"✅ Test solution written to {test_path}")
+        print(f"✅ RISC Zero moves written to {risczero_moves_path}")
 
     def export_for_frontend(self):
         """Export minimal config for frontend (seed only - frontend generates maze)."""
@@ -384,15 +422,14 @@ fn test_generated_solution() {{
         except IOError as e:
             raise IOError(f"Failed to write frontend config to {output_path}: {e}")
 
-    def visualize(self) -> str:
-        """Create ASCII visualization of the maze."""
-        grid = self.to_binary_grid()
-        lines = []
-        for row in grid:
-            # Double each character horizontally to compensate for terminal character aspect ratio
-            line = "".join(("██" if cell == 0 else "  ") for cell in row)
-            lines.append(line)
-        return "\n".join(lines)
+    def visualize(self, grid: Optional[List[List[int]]] = None) -> str:
+        """Create ASCII visualization of the maze (optionally from a prebuilt grid)."""
+        if grid is None:
+            grid = self.to_binary_grid()
+        # Render all rows with one C-level translate, then widen each cell to two
+        # characters to compensate for terminal character aspect ratio
+        text = b"\n".join(map(bytes, grid)).translate(PREVIEW_TABLE).decode()
+        return text.replace("#", "██").replace(".", "  ")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -418,12 +455,14 @@ def main():
         print(f"🎲 Generating {CELL_ROWS}x{CELL_COLS} maze...")
         maze = Maze(CELL_ROWS, CELL_COLS, args.seed)
         maze.generate_recursive_backtracker()
+        # Build the binary grid once for both the Noir export and the preview
+        grid = maze.to_binary_grid()
 
         print(f"🌱 Seed: {maze.seed}")
         print()
 
         # Export for Noir
-        maze.export_for_noir()
+        maze.export_for_noir(grid)
 
         # Export for frontend
         maze.export_for_frontend()
@@ -432,7 +471,7 @@ def main():
         if not args.no_preview:
             print()
             print("Preview:")
-            print(maze.visualize())
+            print(maze.visualize(grid))
 
         print()
         print(f"✨ To regenerate this exact maze, run: python3 generate_maze.py {maze.seed}")
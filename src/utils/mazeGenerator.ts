@@ -45,6 +45,10 @@ export class MazeGenerator {
   // Emulates: int((state / M) * n) = (state * n) / M
   private choiceIndex(n: number): number {
     const M = 2147483647; // 2^31 - 1
+    // The product stays below 2^48 (the first step multiplies the raw 32-bit
+    // seed), so it is exact in a double. A Mersenne fold could replace % M,
+    // but bitwise operators truncate to 32 bits: write p >> 31 as
+    // Math.floor(p / 2147483648), not with >>.
     this.rngState = (this.rngState * 48271) % M;
     // Use integer division to emulate float-based selection
     return Math.floor((this.rngState * n) / M);